@@ -0,0 +1,30 @@
+"""
+Compilación anticipada (AOT) de los núcleos de utils_numba.
+
+Genera el módulo de extensión nativo `voraz_kernels` junto a este archivo:
+
+    python kernels_aot.py
+
+Cuando el módulo existe, utils_numba lo usa en lugar del JIT, de modo que
+los programas no pagan el tiempo de compilación en la primera llamada.
+
+Nota: este paso es opcional y depende de numba.pycc, que Numba marca como
+obsoleto (NumbaPendingDeprecationWarning) y planea eliminar. Los programas
+no deben depender de él: sin `voraz_kernels` se usa el JIT de utils_numba.
+"""
+
+import os
+
+from numba.pycc import CC
+
+import utils_numba
+
+cc = CC('voraz_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+for nombre, (nucleo, firma) in utils_numba.FIRMAS_AOT.items():
+    cc.export(nombre, firma)(getattr(nucleo, 'py_func', nucleo))
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -3,35 +3,201 @@ Problema del Cambio (Change-Making Problem)
 Algoritmo Voraz para dar cambio con la menor cantidad de monedas.
 
 Monedas disponibles: {1, 5, 10, 25}
+
+Para sistemas de monedas no canónicos (donde el voraz no es óptimo) se usa
+programación dinámica.
 """
 
+from functools import lru_cache
+from itertools import starmap
+from operator import mul
+from typing import Optional
+
+import numpy as np
+
+from utils_numba import cambio_minimo
+
 
-def dar_cambio_voraz(cantidad: int, monedas: list[int] = [25, 10, 5, 1]) -> dict[int, int]:
+MONEDAS_CANONICAS = [25, 10, 5, 1]
+
+# Tamaño máximo de las tablas de programación dinámica (cantidades tras la reducción)
+LIMITE_TABLA_DP = 10**6
+
+
+@lru_cache(maxsize=4096)
+def dar_cambio_voraz_canonico(cantidad: int) -> tuple[int, int, int, int]:
     """
-    Resuelve el problema del cambio usando un algoritmo voraz.
+    Versión especializada del algoritmo voraz para el sistema {25, 10, 5, 1}.
     
-    Estrategia: Siempre elegir la moneda de mayor denominación posible.
+    Las cuatro divisiones están desenrolladas y el resultado se memoriza,
+    ya que es común calcular el cambio de las mismas cantidades varias veces.
     
     Args:
         cantidad: La cantidad total a cambiar
-        monedas: Lista de monedas disponibles (ordenadas de mayor a menor)
     
     Returns:
-        Diccionario con la cantidad de cada moneda utilizada
+        Tupla con la cantidad de monedas de (25, 10, 5, 1)
+    """
+    q25, resto = divmod(cantidad, 25)
+    q10, resto = divmod(resto, 10)
+    q5, q1 = divmod(resto, 5)
+    return q25, q10, q5, q1
+
+
+def _num_monedas_voraz(cantidad: int, monedas: tuple[int, ...]) -> Optional[int]:
+    """Número de monedas que usa el voraz, o None si no logra el cambio exacto."""
+    total = 0
+    for moneda in monedas:
+        q, cantidad = divmod(cantidad, moneda)
+        total += q
+    return total if cantidad == 0 else None
+
+
+@lru_cache(maxsize=None)
+def es_sistema_canonico(monedas: tuple[int, ...]) -> bool:
+    """
+    Determina si el algoritmo voraz es óptimo para un sistema de monedas.
+    
+    Si existe un contraejemplo, el menor es menor que la suma de las dos
+    monedas más grandes (Kozen y Zaks), así que basta comparar el voraz contra
+    la programación dinámica en ese rango. El resultado se memoriza por sistema.
+    
+    Args:
+        monedas: Denominaciones ordenadas de mayor a menor
+    
+    Returns:
+        True si el voraz da siempre el mínimo número de monedas
+    
+    Raises:
+        ValueError: Si la suma de las dos monedas mayores supera LIMITE_TABLA_DP
+    """
+    if 1 not in monedas:
+        return False
+    if len(monedas) < 3:
+        return True
+    
+    limite = monedas[0] + monedas[1]
+    if limite > LIMITE_TABLA_DP:
+        raise ValueError(
+            f"Las monedas {monedas[0]} y {monedas[1]} son demasiado grandes para "
+            f"verificar si el sistema es canónico"
+        )
+    minimo = [0] * limite
+    for d in range(1, limite):
+        minimo[d] = 1 + min(minimo[d - m] for m in monedas if m <= d)
+        if _num_monedas_voraz(d, monedas) != minimo[d]:
+            return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _cambio_memorizado(cantidad: int, monedas: tuple[int, ...]) -> tuple[tuple[int, int], ...]:
+    """
+    Núcleo memorizado de dar_cambio_voraz para un sistema de monedas cualquiera.
+    
+    Returns:
+        Tupla de pares (moneda, cantidad_monedas), de mayor a menor denominación
     """
     # Ordenar monedas de mayor a menor (asegurar orden correcto)
     monedas_ordenadas = sorted(monedas, reverse=True)
     
-    resultado = {}
+    if not es_sistema_canonico(tuple(monedas_ordenadas)):
+        # Una solución óptima usa menos de M monedas distintas de la mayor M: entre
+        # M monedas menores siempre hay un subconjunto cuya suma es múltiplo kM, y k
+        # monedas de M lo mejorarían. Esas monedas suman menos de M*(M-1), así que
+        # por encima de esa cota se pueden apartar monedas de M sin perder optimalidad.
+        mayor = monedas_ordenadas[0]
+        cota = mayor * (mayor - 1)
+        extra = -(-(cantidad - cota) // mayor) if cantidad > cota else 0
+        resto = cantidad - extra * mayor
+        if resto > LIMITE_TABLA_DP:
+            raise ValueError(
+                f"La moneda {mayor} es demasiado grande para calcular el cambio mínimo "
+                f"(la tabla necesitaría más de {LIMITE_TABLA_DP} posiciones)"
+            )
+        
+        conteos = cambio_minimo(resto, np.asarray(monedas_ordenadas, dtype=np.int64))
+        if len(conteos) > 0:
+            conteos[0] += extra
+            return tuple((moneda, c) for moneda, c in zip(monedas_ordenadas, conteos.tolist()) if c > 0)
+    
+    resultado = []
     cantidad_restante = cantidad
     
     for moneda in monedas_ordenadas:
         if cantidad_restante >= moneda:
             cantidad_monedas = cantidad_restante // moneda
-            resultado[moneda] = cantidad_monedas
+            resultado.append((moneda, cantidad_monedas))
             cantidad_restante = cantidad_restante % moneda
     
-    return resultado
+    return tuple(resultado)
+
+
+def dar_cambio_voraz(cantidad: int, monedas: list[int] = MONEDAS_CANONICAS) -> dict[int, int]:
+    """
+    Resuelve el problema del cambio usando un algoritmo voraz.
+    
+    Estrategia: Siempre elegir la moneda de mayor denominación posible.
+    
+    Si el sistema de monedas no es canónico, el voraz puede no ser óptimo y se
+    calcula el cambio mínimo por programación dinámica.
+    
+    Args:
+        cantidad: La cantidad total a cambiar
+        monedas: Lista de monedas disponibles (ordenadas de mayor a menor)
+    
+    Returns:
+        Diccionario con la cantidad de cada moneda utilizada
+    
+    Raises:
+        ValueError: Si la cantidad no es un número entero, o si el sistema no es
+                    canónico y la cantidad (reducida por debajo de M*(M-1), con M
+                    la moneda mayor) supera LIMITE_TABLA_DP
+    """
+    # Los núcleos compilados trabajan con enteros: aceptar 7.0, rechazar 7.5
+    if cantidad != int(cantidad):
+        raise ValueError("La cantidad a cambiar debe ser un número entero")
+    cantidad = int(cantidad)
+    
+    # Sin cambio que dar (una cantidad negativa tampoco admite cambio)
+    if cantidad <= 0:
+        return {}
+    
+    # Camino rápido para el sistema canónico por defecto
+    if monedas == MONEDAS_CANONICAS:
+        conteos = dar_cambio_voraz_canonico(cantidad)
+        return {moneda: c for moneda, c in zip(MONEDAS_CANONICAS, conteos) if c > 0}
+    
+    return dict(_cambio_memorizado(cantidad, tuple(monedas)))
+
+
+def dar_cambio_voraz_lote(cantidades: list[int]) -> np.ndarray:
+    """
+    Aplica el algoritmo voraz del sistema {25, 10, 5, 1} a todas las cantidades a la vez.
+    
+    Cada denominación se resuelve con una sola división entera vectorizada
+    sobre el lote completo.
+    
+    Args:
+        cantidades: Cantidades a cambiar
+    
+    Returns:
+        Arreglo de forma (len(cantidades), 4) con las monedas de (25, 10, 5, 1)
+        para cada cantidad (una fila de ceros si la cantidad no es positiva)
+    
+    Raises:
+        ValueError: Si alguna cantidad no es un número entero
+    """
+    valores = np.asarray(cantidades)
+    if np.any(valores != np.trunc(valores)):
+        raise ValueError("La cantidad a cambiar debe ser un número entero")
+    
+    # Las cantidades no positivas no reciben monedas, igual que en dar_cambio_voraz
+    resto = np.maximum(valores.astype(np.int64), 0)
+    q25, resto = np.divmod(resto, 25)
+    q10, resto = np.divmod(resto, 10)
+    q5, q1 = np.divmod(resto, 5)
+    return np.stack([q25, q10, q5, q1], axis=1)
 
 
 def mostrar_cambio(cantidad: int, resultado: dict[int, int]) -> None:
@@ -56,7 +222,7 @@ def mostrar_cambio(cantidad: int, resultado: dict[int, int]) -> None:
     print(f"Total de monedas utilizadas: {total_monedas}")
     
     # Verificar que la suma es correcta
-    suma_verificacion = sum(moneda * cantidad for moneda, cantidad in resultado.items())
+    suma_verificacion = sum(starmap(mul, resultado.items()))
     print(f"Verificación: ${suma_verificacion} (esperado: ${cantidad})")
     if suma_verificacion == cantidad:
         print("✓ Verificación correcta")
@@ -90,8 +256,9 @@ def probar_casos():
         250,    # Caso grande
     ]
     
-    for cantidad in casos_prueba:
-        resultado = dar_cambio_voraz(cantidad)
+    conteos = dar_cambio_voraz_lote(casos_prueba)
+    for cantidad, fila in zip(casos_prueba, conteos.tolist()):
+        resultado = {moneda: c for moneda, c in zip(MONEDAS_CANONICAS, fila) if c > 0}
         mostrar_cambio(cantidad, resultado)
     
     print("\n" + "=" * 60)
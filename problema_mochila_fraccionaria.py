@@ -5,25 +5,71 @@ Algoritmo Voraz para maximizar el valor en una mochila con capacidad limitada.
 Estrategia: Ordenar por ratio valor/peso (densidad de valor) y tomar fracciones si es necesario.
 """
 
-import random
 from typing import List, Tuple
 
+import numpy as np
+
+
+# Fracción del peso total (y de n) por debajo de la cual conviene la selección parcial
+FRACCION_PARCIAL = 0.25
+
 
 class Articulo:
-    """Representa un artículo con peso y valor."""
+    """Representa un artículo con peso (mayor que 0) y valor."""
+    
+    __slots__ = ('peso', 'valor', 'nombre', 'ratio')
     
     def __init__(self, peso: float, valor: float, nombre: str = ""):
         self.peso = peso
         self.valor = valor
         self.nombre = nombre
-        self.ratio = valor / peso if peso > 0 else 0
+        self.ratio = valor / peso
     
     def __repr__(self):
         return f"Articulo(peso={self.peso}, valor={self.valor}, ratio={self.ratio:.2f})"
 
 
+def _indices_mejor_ratio(ratios: np.ndarray, pesos: np.ndarray, capacidad: float) -> np.ndarray:
+    """
+    Índices de los artículos de mayor ratio, ordenados de mayor a menor.
+    
+    Si la capacidad es pequeña respecto al peso total, solo ordena los artículos
+    cuyo ratio está entre los k mejores (selección parcial con np.partition),
+    duplicando k hasta que su peso conjunto alcance la capacidad. En otro caso,
+    o si k llega a una cuarta parte de n, ordena todos los artículos.
+    
+    Args:
+        ratios: Ratio valor/peso de cada artículo
+        pesos: Peso de cada artículo
+        capacidad: Capacidad máxima de la mochila
+    
+    Returns:
+        Índices de los artículos candidatos ordenados por ratio (mayor a menor)
+    """
+    n = len(ratios)
+    negativos = -ratios
+    peso_total = float(pesos.sum())
+    
+    if capacidad < FRACCION_PARCIAL * peso_total:
+        # Estimar k con el peso promedio, con holgura para artículos más pesados
+        k = max(64, 2 * int(np.ceil(capacidad * n / peso_total)))
+        while k <= n * FRACCION_PARCIAL:
+            # Incluir todos los empatados con el k-ésimo mejor ratio, para que los
+            # candidatos sean exactamente un prefijo del orden completo
+            umbral = np.partition(negativos, k - 1)[k - 1]
+            candidatos = np.flatnonzero(negativos <= umbral)
+            if pesos[candidatos].sum() >= capacidad:
+                return candidatos[np.argsort(negativos[candidatos], kind="stable")]
+            k *= 2
+    
+    # Orden estable: ante empates se respeta el orden original
+    return np.argsort(negativos, kind="stable")
+
+
 def mochila_fraccionaria_voraz(
-    articulos: List[Articulo], 
+    pesos: np.ndarray,
+    valores: np.ndarray,
+    nombres: List[str],
     capacidad: float
 ) -> Tuple[List[Tuple[Articulo, float]], float]:
     """
@@ -32,8 +78,14 @@ def mochila_fraccionaria_voraz(
     Estrategia: Ordenar por ratio valor/peso (mayor a menor) y tomar artículos completos
     o fracciones hasta llenar la mochila.
     
+    Los artículos se reciben como arreglos paralelos (pesos, valores, nombres) para que
+    el cálculo de ratios, la ordenación y la búsqueda del punto de corte se hagan con
+    operaciones vectorizadas de NumPy en lugar de un ciclo en Python.
+    
     Args:
-        articulos: Lista de artículos disponibles
+        pesos: Arreglo con el peso de cada artículo
+        valores: Arreglo con el valor de cada artículo
+        nombres: Lista con el nombre de cada artículo
         capacidad: Capacidad máxima de la mochila
     
     Returns:
@@ -41,35 +93,49 @@ def mochila_fraccionaria_voraz(
         - Lista de tuplas (artículo, fracción_tomada)
         - Valor total obtenido
     """
-    # Ordenar artículos por ratio valor/peso (mayor a menor)
-    articulos_ordenados = sorted(articulos, key=lambda x: x.ratio, reverse=True)
-    
-    mochila = []
-    capacidad_restante = capacidad
-    valor_total = 0.0
-    
-    for articulo in articulos_ordenados:
-        if capacidad_restante <= 0:
-            break
-        
-        if articulo.peso <= capacidad_restante:
-            # Tomar el artículo completo
-            mochila.append((articulo, 1.0))
-            valor_total += articulo.valor
-            capacidad_restante -= articulo.peso
-        else:
-            # Tomar una fracción del artículo
-            fraccion = capacidad_restante / articulo.peso
-            mochila.append((articulo, fraccion))
-            valor_total += articulo.valor * fraccion
-            capacidad_restante = 0
+    if np.any(pesos <= 0):
+        raise ValueError("El peso de cada artículo debe ser mayor que 0")
+    
+    if capacidad <= 0 or len(pesos) == 0:
+        return [], 0.0
+    
+    ratios = valores / pesos
+    orden = _indices_mejor_ratio(ratios, pesos, capacidad)
+    pesos_ordenados = pesos[orden]
+    valores_ordenados = valores[orden]
+    
+    # Número de artículos que caben completos: búsqueda binaria sobre el peso acumulado
+    peso_acumulado = np.cumsum(pesos_ordenados)
+    corte = int(np.searchsorted(peso_acumulado, capacidad, side='right'))
+    
+    completos = orden[:corte]
+    mochila = [
+        (Articulo(peso, valor, nombres[i]), 1.0)
+        for i, peso, valor in zip(completos.tolist(),
+                                  pesos_ordenados[:corte].tolist(),
+                                  valores_ordenados[:corte].tolist())
+    ]
+    valor_total = float(valores_ordenados[:corte].sum())
+    
+    capacidad_restante = capacidad - (float(peso_acumulado[corte - 1]) if corte > 0 else 0.0)
+    if corte < len(orden) and capacidad_restante > 0:
+        # Tomar una fracción del artículo en el punto de corte
+        i = int(orden[corte])
+        articulo = Articulo(float(pesos_ordenados[corte]), float(valores_ordenados[corte]), nombres[i])
+        fraccion = capacidad_restante / articulo.peso
+        mochila.append((articulo, fraccion))
+        valor_total += articulo.valor * fraccion
     
     return mochila, valor_total
 
 
-def generar_articulos_aleatorios(n: int, peso_max: float = 100.0, valor_max: float = 1000.0) -> List[Articulo]:
+def generar_articulos_aleatorios(
+    n: int,
+    peso_max: float = 100.0,
+    valor_max: float = 1000.0
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
     """
-    Genera una lista de artículos aleatorios para pruebas.
+    Genera artículos aleatorios para pruebas.
     
     Args:
         n: Número de artículos a generar
@@ -77,18 +143,17 @@ def generar_articulos_aleatorios(n: int, peso_max: float = 100.0, valor_max: flo
         valor_max: Valor máximo de un artículo
     
     Returns:
-        Lista de artículos generados
+        Tupla con:
+        - Arreglo de pesos (float64)
+        - Arreglo de valores (float64)
+        - Lista de nombres
     """
-    random.seed(42)  # Para reproducibilidad
-    articulos = []
+    rng = np.random.default_rng(42)  # Para reproducibilidad
+    pesos = np.round(rng.uniform(1.0, peso_max, n), 2)
+    valores = np.round(rng.uniform(10.0, valor_max, n), 2)
+    nombres = [f"Artículo {i+1}" for i in range(n)]
     
-    for i in range(n):
-        peso = round(random.uniform(1.0, peso_max), 2)
-        valor = round(random.uniform(10.0, valor_max), 2)
-        nombre = f"Artículo {i+1}"
-        articulos.append(Articulo(peso, valor, nombre))
-    
-    return articulos
+    return pesos, valores, nombres
 
 
 def mostrar_resultado_mochila(
@@ -110,24 +175,25 @@ def mostrar_resultado_mochila(
     print(f"RESULTADO MOCHILA FRACCIONARIA ({num_articulos} artículos, capacidad: {capacidad})")
     print(f"{'='*70}")
     
-    peso_total = 0.0
+    peso_total = sum(articulo.peso * fraccion for articulo, fraccion in mochila)
     print(f"\nArtículos seleccionados:")
-    print(f"{'Nombre':<15} {'Peso':>10} {'Valor':>10} {'Ratio':>10} {'Fracción':>10} {'Valor Obtenido':>15}")
-    print("-" * 70)
     
-    for articulo, fraccion in mochila:
-        peso_usado = articulo.peso * fraccion
-        valor_obtenido = articulo.valor * fraccion
-        peso_total += peso_usado
-        
-        print(f"{articulo.nombre:<15} "
-              f"{articulo.peso:>10.2f} "
-              f"{articulo.valor:>10.2f} "
-              f"{articulo.ratio:>10.2f} "
-              f"{fraccion:>10.2%} "
-              f"{valor_obtenido:>15.2f}")
-    
-    print("-" * 70)
+    # Armar la tabla completa y escribirla de una sola vez
+    lineas = [
+        f"{'Nombre':<15} {'Peso':>10} {'Valor':>10} {'Ratio':>10} {'Fracción':>10} {'Valor Obtenido':>15}",
+        "-" * 70,
+    ]
+    lineas.extend(
+        f"{articulo.nombre:<15} "
+        f"{articulo.peso:>10.2f} "
+        f"{articulo.valor:>10.2f} "
+        f"{articulo.ratio:>10.2f} "
+        f"{fraccion:>10.2%} "
+        f"{articulo.valor * fraccion:>15.2f}"
+        for articulo, fraccion in mochila
+    )
+    lineas.append("-" * 70)
+    print("\n".join(lineas))
     print(f"Peso total utilizado: {peso_total:.2f} / {capacidad:.2f}")
     print(f"Valor total obtenido: {valor_total:.2f}")
     print(f"Eficiencia (valor/peso): {valor_total/peso_total:.2f}" if peso_total > 0 else "")
@@ -150,13 +216,13 @@ def probar_mochila_fraccionaria():
         print(f"{'#'*70}")
         
         # Generar artículos aleatorios
-        articulos = generar_articulos_aleatorios(num_articulos)
+        pesos, valores, nombres = generar_articulos_aleatorios(num_articulos)
         
         # Calcular capacidad basada en el número de artículos
         capacidad = capacidad_base * (num_articulos / 10)
         
         # Resolver el problema
-        mochila, valor_total = mochila_fraccionaria_voraz(articulos, capacidad)
+        mochila, valor_total = mochila_fraccionaria_voraz(pesos, valores, nombres, capacidad)
         
         # Mostrar resultados
         mostrar_resultado_mochila(mochila, valor_total, capacidad, num_articulos)
@@ -6,13 +6,21 @@ Dado un conjunto de actividades con tiempo de inicio y fin,
 selecciona el máximo número de actividades posibles de manera que no se traslapen.
 """
 
-from typing import List, Tuple
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import List, Optional, Tuple, Union
 import random
 
+import numpy as np
+
+from utils_numba import seleccionar_compatibles
+
 
 class Actividad:
     """Representa una actividad con tiempo de inicio y fin."""
     
+    __slots__ = ('inicio', 'fin', 'nombre', 'duracion')
+    
     def __init__(self, inicio: int, fin: int, nombre: str = ""):
         if inicio >= fin:
             raise ValueError("El tiempo de inicio debe ser menor que el tiempo de fin")
@@ -21,6 +29,47 @@ class Actividad:
         self.nombre = nombre
         self.duracion = fin - inicio
     
+    @classmethod
+    def desde_arreglos(
+        cls,
+        inicios: np.ndarray,
+        fines: np.ndarray,
+        nombres: List[str]
+    ) -> List['Actividad']:
+        """
+        Construye varias actividades a partir de arreglos paralelos.
+        
+        Los intervalos se validan todos juntos con una sola comparación vectorizada,
+        en lugar de validar cada actividad en su constructor.
+        
+        Args:
+            inicios: Tiempos de inicio
+            fines: Tiempos de fin
+            nombres: Nombres de las actividades
+        
+        Returns:
+            Lista de actividades construidas
+        """
+        inicios = np.asarray(inicios, dtype=np.int64)
+        fines = np.asarray(fines, dtype=np.int64)
+        if not (len(inicios) == len(fines) == len(nombres)):
+            raise ValueError("Los arreglos de inicios, fines y nombres deben tener la misma longitud")
+        if not np.all(inicios < fines):
+            raise ValueError("El tiempo de inicio debe ser menor que el tiempo de fin")
+        
+        actividades = []
+        for inicio, fin, duracion, nombre in zip(
+            inicios.tolist(), fines.tolist(), (fines - inicios).tolist(), nombres
+        ):
+            actividad = cls.__new__(cls)
+            actividad.inicio = inicio
+            actividad.fin = fin
+            actividad.nombre = nombre
+            actividad.duracion = duracion
+            actividades.append(actividad)
+        
+        return actividades
+    
     def __repr__(self):
         return f"Actividad({self.inicio}-{self.fin}, '{self.nombre}')"
     
@@ -37,7 +86,73 @@ class Actividad:
         return not (self.fin <= otra.inicio or otra.fin <= self.inicio)
 
 
-def seleccion_actividades_voraz(actividades: List[Actividad]) -> List[Actividad]:
+@dataclass(eq=False)
+class LoteActividades:
+    """
+    Conjunto de actividades guardado como arreglos paralelos (inicio, fin, nombre).
+    
+    Los tiempos viven en arreglos int64 contiguos en lugar de un objeto por
+    actividad, de modo que ordenar, seleccionar y verificar se hace sin
+    acceder a atributos de objetos de Python.
+    
+    Si el lote es un subconjunto de otro (por ejemplo, la salida de
+    seleccion_actividades_voraz), `origen` guarda la posición de cada actividad
+    en el conjunto original.
+    """
+    
+    inicios: np.ndarray
+    fines: np.ndarray
+    nombres: List[str]
+    origen: Optional[np.ndarray] = None
+    
+    def __post_init__(self):
+        self.inicios = np.asarray(self.inicios, dtype=np.int64)
+        self.fines = np.asarray(self.fines, dtype=np.int64)
+        if not (len(self.inicios) == len(self.fines) == len(self.nombres)):
+            raise ValueError("Los arreglos de inicios, fines y nombres deben tener la misma longitud")
+        if not np.all(self.inicios < self.fines):
+            raise ValueError("El tiempo de inicio debe ser menor que el tiempo de fin")
+        if self.origen is not None:
+            self.origen = np.asarray(self.origen, dtype=np.int64)
+            if len(self.origen) != len(self.nombres):
+                raise ValueError("El arreglo de origen debe tener la misma longitud que el lote")
+    
+    def __len__(self):
+        return len(self.nombres)
+    
+    @classmethod
+    def desde_actividades(cls, actividades: List[Actividad]) -> 'LoteActividades':
+        """Construye un lote a partir de una lista de actividades."""
+        n = len(actividades)
+        return cls(
+            np.fromiter((act.inicio for act in actividades), dtype=np.int64, count=n),
+            np.fromiter((act.fin for act in actividades), dtype=np.int64, count=n),
+            [act.nombre for act in actividades],
+        )
+    
+    def subconjunto(self, indices: np.ndarray) -> 'LoteActividades':
+        """Devuelve un nuevo lote con las actividades en las posiciones dadas."""
+        indices = np.asarray(indices, dtype=np.int64)
+        return LoteActividades(
+            self.inicios[indices],
+            self.fines[indices],
+            [self.nombres[i] for i in indices.tolist()],
+            # Las posiciones se expresan siempre respecto al conjunto original
+            indices if self.origen is None else self.origen[indices],
+        )
+
+
+ConjuntoActividades = Union[List[Actividad], LoteActividades]
+
+
+def _como_lote(actividades: ConjuntoActividades) -> LoteActividades:
+    """Devuelve las actividades como LoteActividades, convirtiéndolas si es necesario."""
+    if isinstance(actividades, LoteActividades):
+        return actividades
+    return LoteActividades.desde_actividades(actividades)
+
+
+def seleccion_actividades_voraz(actividades: ConjuntoActividades) -> ConjuntoActividades:
     """
     Resuelve el problema de selección de actividades usando algoritmo voraz.
     
@@ -45,27 +160,21 @@ def seleccion_actividades_voraz(actividades: List[Actividad]) -> List[Actividad]
     que no se traslapen, siempre eligiendo la que termina más temprano.
     
     Args:
-        actividades: Lista de actividades disponibles
+        actividades: Lista de actividades o LoteActividades disponibles
     
     Returns:
-        Lista de actividades seleccionadas (máximo número sin traslape)
+        Actividades seleccionadas (máximo número sin traslape), ordenadas por fin
+        y en el mismo formato que la entrada
     """
-    if not actividades:
-        return []
+    lote = _como_lote(actividades)
     
-    # Ordenar actividades por tiempo de fin (menor a mayor)
-    actividades_ordenadas = sorted(actividades, key=lambda x: x.fin)
+    # Ordenar por tiempo de fin (menor a mayor) y recorrer con el núcleo compilado
+    orden = np.argsort(lote.fines, kind="stable")
+    indices = orden[seleccionar_compatibles(lote.inicios[orden], lote.fines[orden])]
     
-    seleccionadas = []
-    ultimo_fin = -1  # Tiempo de fin de la última actividad seleccionada
-    
-    for actividad in actividades_ordenadas:
-        # Si la actividad comienza después o al mismo tiempo que termina la última seleccionada
-        if actividad.inicio >= ultimo_fin:
-            seleccionadas.append(actividad)
-            ultimo_fin = actividad.fin
-    
-    return seleccionadas
+    if isinstance(actividades, LoteActividades):
+        return lote.subconjunto(indices)
+    return [actividades[i] for i in indices.tolist()]
 
 
 def generar_actividades_aleatorias(n: int, tiempo_max: int = 100) -> List[Actividad]:
@@ -80,37 +189,52 @@ def generar_actividades_aleatorias(n: int, tiempo_max: int = 100) -> List[Activi
         Lista de actividades generadas
     """
     random.seed(42)  # Para reproducibilidad
-    actividades = []
+    inicios = []
+    fines = []
     
-    for i in range(n):
+    for _ in range(n):
         inicio = random.randint(0, tiempo_max - 1)
-        fin = random.randint(inicio + 1, tiempo_max)
-        nombre = f"Actividad {i+1}"
-        actividades.append(Actividad(inicio, fin, nombre))
+        inicios.append(inicio)
+        fines.append(random.randint(inicio + 1, tiempo_max))
     
-    return actividades
+    nombres = [f"Actividad {i+1}" for i in range(n)]
+    
+    return Actividad.desde_arreglos(inicios, fines, nombres)
 
 
-def verificar_sin_traslape(actividades: List[Actividad]) -> bool:
+def verificar_sin_traslape(actividades: ConjuntoActividades, ordenadas: bool = False) -> bool:
     """
     Verifica que las actividades seleccionadas no se traslapen.
     
+    Recorre las actividades ordenadas una sola vez comparando cada una con la
+    siguiente, en O(n log n) (u O(n) si ya vienen ordenadas).
+    
     Args:
-        actividades: Lista de actividades a verificar
+        actividades: Lista de actividades o LoteActividades a verificar
+        ordenadas: True si las actividades ya vienen ordenadas por inicio o por fin
+                   (por ejemplo, la salida de seleccion_actividades_voraz)
     
     Returns:
         True si no hay traslapes, False en caso contrario
     """
-    for i in range(len(actividades)):
-        for j in range(i + 1, len(actividades)):
-            if actividades[i].traslapa_con(actividades[j]):
-                return False
-    return True
+    if isinstance(actividades, LoteActividades):
+        inicios, fines = actividades.inicios, actividades.fines
+        if not ordenadas:
+            orden = np.argsort(inicios, kind="stable")
+            inicios, fines = inicios[orden], fines[orden]
+        return bool(np.all(fines[:-1] <= inicios[1:]))
+    
+    if not ordenadas:
+        actividades = sorted(actividades, key=attrgetter('inicio'))
+    return all(
+        actividades[i].fin <= actividades[i + 1].inicio
+        for i in range(len(actividades) - 1)
+    )
 
 
 def mostrar_resultado_actividades(
-    actividades_disponibles: List[Actividad],
-    actividades_seleccionadas: List[Actividad]
+    actividades_disponibles: ConjuntoActividades,
+    actividades_seleccionadas: ConjuntoActividades
 ) -> None:
     """
     Muestra el resultado de la selección de actividades de forma legible.
@@ -118,56 +242,80 @@ def mostrar_resultado_actividades(
     Args:
         actividades_disponibles: Todas las actividades disponibles
         actividades_seleccionadas: Actividades seleccionadas por el algoritmo
+    
+    Raises:
+        ValueError: Si la selección es una lista y las disponibles un lote, o un
+                    lote sin `origen`, ya que no se puede saber cuáles se eligieron
     """
+    disponibles = _como_lote(actividades_disponibles)
+    seleccionadas = _como_lote(actividades_seleccionadas)
+    
+    # Marcar las actividades seleccionadas
+    if isinstance(actividades_disponibles, list) and isinstance(actividades_seleccionadas, list):
+        # Actividad no define __eq__/__hash__, así que se compara por identidad
+        ids_seleccionadas = {id(act) for act in actividades_seleccionadas}
+        marcas = [id(act) in ids_seleccionadas for act in actividades_disponibles]
+    elif seleccionadas.origen is not None:
+        # La selección recuerda la posición de cada actividad en las disponibles
+        marcas = np.zeros(len(disponibles), dtype=bool)
+        marcas[seleccionadas.origen] = True
+        marcas = marcas.tolist()
+    else:
+        raise ValueError(
+            "No se puede relacionar la selección con las actividades disponibles; "
+            "use la salida de seleccion_actividades_voraz"
+        )
+    
     print(f"\n{'='*80}")
     print(f"SELECCIÓN DE ACTIVIDADES")
     print(f"{'='*80}")
     
-    print(f"\nActividades disponibles: {len(actividades_disponibles)}")
-    print(f"Actividades seleccionadas: {len(actividades_seleccionadas)}")
+    print(f"\nActividades disponibles: {len(disponibles)}")
+    print(f"Actividades seleccionadas: {len(seleccionadas)}")
     
     # Mostrar todas las actividades ordenadas por inicio
     print(f"\nTodas las actividades (ordenadas por inicio):")
-    print(f"{'Nombre':<15} {'Inicio':>8} {'Fin':>8} {'Duración':>10}")
-    print("-" * 50)
-    
-    actividades_ordenadas = sorted(actividades_disponibles, key=lambda x: x.inicio)
-    for actividad in actividades_ordenadas:
-        marcador = "✓" if actividad in actividades_seleccionadas else " "
-        print(f"{marcador} {actividad.nombre:<13} "
-              f"{actividad.inicio:>8} "
-              f"{actividad.fin:>8} "
-              f"{actividad.duracion:>10}")
+    orden = np.argsort(disponibles.inicios, kind="stable").tolist()
+    inicios = disponibles.inicios.tolist()
+    fines = disponibles.fines.tolist()
+    
+    # Armar la tabla completa y escribirla de una sola vez
+    lineas = [f"{'Nombre':<15} {'Inicio':>8} {'Fin':>8} {'Duración':>10}", "-" * 50]
+    lineas.extend(
+        f"{'✓' if marcas[i] else ' '} {disponibles.nombres[i]:<13} "
+        f"{inicios[i]:>8} "
+        f"{fines[i]:>8} "
+        f"{fines[i] - inicios[i]:>10}"
+        for i in orden
+    )
+    print("\n".join(lineas))
     
     # Mostrar línea de tiempo
     print(f"\nLínea de tiempo (actividades seleccionadas marcadas con ✓):")
-    tiempo_max = max(act.fin for act in actividades_disponibles)
+    tiempo_max = int(disponibles.fines.max())
     
-    # Crear representación visual simple
-    linea = [' '] * (tiempo_max + 1)
-    for actividad in actividades_seleccionadas:
-        for i in range(actividad.inicio, actividad.fin):
-            if i < len(linea):
-                linea[i] = '█'
+    # Crear representación visual simple: solo se evalúan los instantes muestreados,
+    # contando inicios y fines de las seleccionadas. Cada arreglo se ordena por
+    # separado: si hubiera traslapes, los fines no quedarían ordenados por inicio
+    muestras = np.arange(0, tiempo_max + 1, max(1, tiempo_max // 20))
+    inicios_seleccionadas = np.sort(seleccionadas.inicios)
+    fines_seleccionadas = np.sort(seleccionadas.fines)
     
-    print("Tiempo: ", end="")
-    for i in range(0, tiempo_max + 1, max(1, tiempo_max // 20)):
-        print(f"{i:3d}", end="")
-    print()
+    # Actividades con inicio <= t menos las que ya terminaron (fin <= t)
+    activas = (np.searchsorted(inicios_seleccionadas, muestras, side='right')
+               - np.searchsorted(fines_seleccionadas, muestras, side='right'))
     
-    print("Actividades: ", end="")
-    for i in range(0, tiempo_max + 1, max(1, tiempo_max // 20)):
-        print(f" {linea[i]} ", end="")
-    print()
+    print("Tiempo: " + "".join(f"{i:3d}" for i in muestras.tolist()))
+    print("Actividades: " + "".join(f" {'█' if a > 0 else ' '} " for a in activas.tolist()))
     
     # Verificar que no hay traslapes
-    if verificar_sin_traslape(actividades_seleccionadas):
+    if verificar_sin_traslape(seleccionadas):
         print("\n✓ Verificación: Las actividades seleccionadas NO se traslapan")
     else:
         print("\n✗ ERROR: Las actividades seleccionadas SÍ se traslapan")
     
     # Calcular tiempo total cubierto
-    tiempo_total = sum(act.duracion for act in actividades_seleccionadas)
+    tiempo_total = int((seleccionadas.fines - seleccionadas.inicios).sum())
     print(f"Tiempo total cubierto: {tiempo_total} unidades")
 
 
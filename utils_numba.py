@@ -0,0 +1,96 @@
+"""
+Núcleos compilados con Numba para los algoritmos voraces.
+
+Si Numba no está instalado, los núcleos se ejecutan como Python puro
+con el mismo resultado (solo más lento).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - Numba es opcional
+    def njit(*args, **kwargs):
+        """Sustituto de numba.njit que devuelve la función sin compilar."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda funcion: funcion
+
+
+@njit(cache=True)
+def seleccionar_compatibles(inicios: np.ndarray, fines: np.ndarray) -> np.ndarray:
+    """
+    Recorre actividades ordenadas por tiempo de fin y selecciona las compatibles.
+    
+    Args:
+        inicios: Tiempos de inicio (int64), en el mismo orden que fines
+        fines: Tiempos de fin (int64), ordenados de menor a mayor
+    
+    Returns:
+        Índices (dentro de los arreglos recibidos) de las actividades seleccionadas
+    """
+    seleccionados = np.empty(len(fines), np.int64)
+    k = 0
+    ultimo_fin = -1  # Tiempo de fin de la última actividad seleccionada
+    
+    for i in range(len(fines)):
+        if inicios[i] >= ultimo_fin:
+            seleccionados[k] = i
+            ultimo_fin = fines[i]
+            k += 1
+    
+    return seleccionados[:k]
+
+
+@njit(cache=True)
+def cambio_minimo(cantidad: int, monedas: np.ndarray) -> np.ndarray:
+    """
+    Calcula el cambio con el mínimo número de monedas por programación dinámica.
+    
+    Construye la tabla T[d] = 1 + min(T[d - m]) para toda d <= cantidad.
+    
+    Args:
+        cantidad: La cantidad total a cambiar
+        monedas: Denominaciones disponibles (int64, positivas)
+    
+    Returns:
+        Cantidad de monedas de cada denominación (en el orden recibido), o un
+        arreglo vacío si la cantidad no puede formarse exactamente
+    """
+    infinito = cantidad + 1
+    minimo = np.full(cantidad + 1, infinito, np.int64)
+    ultima = np.full(cantidad + 1, -1, np.int64)  # Índice de la última moneda usada
+    minimo[0] = 0
+    
+    for d in range(1, cantidad + 1):
+        for j in range(len(monedas)):
+            moneda = monedas[j]
+            if moneda <= d and minimo[d - moneda] + 1 < minimo[d]:
+                minimo[d] = minimo[d - moneda] + 1
+                ultima[d] = j
+    
+    conteos = np.zeros(len(monedas), np.int64)
+    if minimo[cantidad] == infinito:
+        return conteos[:0]
+    
+    d = cantidad
+    while d > 0:
+        j = ultima[d]
+        conteos[j] += 1
+        d -= monedas[j]
+    
+    return conteos
+
+
+# Núcleos y firmas que kernels_aot.py exporta al módulo precompilado
+FIRMAS_AOT = {
+    'seleccionar_compatibles': (seleccionar_compatibles, 'i8[:](i8[:], i8[:])'),
+    'cambio_minimo': (cambio_minimo, 'i8[:](i8, i8[:])'),
+}
+
+
+# Si el módulo precompilado existe (python kernels_aot.py), usarlo en lugar del JIT
+try:
+    from voraz_kernels import cambio_minimo, seleccionar_compatibles  # noqa: F811
+except ImportError:
+    pass